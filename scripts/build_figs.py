@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Build the paper figures in one Python process, reusing a single Figure.
+
+Reads:  outputs/cap_vs_dt.csv
+        outputs/reversibility_demo.json
+        outputs/mem_ablate_precond_band/{default,thrash,scramble}/plateau_audit.json
+Writes: paper/figs/fig_cap_engagement_small.pdf
+        paper/figs/fig_reversibility_demo.pdf
+        paper/figs/fig1_lf_precond_small.pdf
+
+Usage:
+  python scripts/build_figs.py
+"""
+
+from pathlib import Path
+
+import figstyle  # noqa: F401
+import matplotlib.pyplot as plt
+
+import make_cap_engagement_plot
+import make_reversibility_plot
+from make_fig1_overlay_from_audits import make_overlay
+
+AUDIT_DIR = Path("outputs/mem_ablate_precond_band")
+FIG1_PATH = Path("paper/figs/fig1_lf_precond_small.pdf")
+
+def main():
+    fig = plt.figure()
+    make_cap_engagement_plot.render(fig=fig)
+    make_reversibility_plot.render(fig=fig)
+    make_overlay(
+        p_default=AUDIT_DIR / "default" / "plateau_audit.json",
+        p_thrash=AUDIT_DIR / "thrash" / "plateau_audit.json",
+        p_scramble=AUDIT_DIR / "scramble" / "plateau_audit.json",
+        out_path=FIG1_PATH,
+        show_fit=True,
+        y_units="nats",
+        legend_band="small-dt band",
+        legend_N=3,
+        fig=fig,
+    )
+    plt.close(fig)
+
+if __name__ == "__main__":
+    main()
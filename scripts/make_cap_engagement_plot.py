@@ -6,44 +6,70 @@ Reads:  outputs/cap_vs_dt.csv
 Writes: paper/figs/fig_cap_engagement_small.pdf
 """
 
-import pandas as pd
+import numpy as np
+import figstyle
 import matplotlib.pyplot as plt
 from pathlib import Path
 
 IN_PATH  = Path("outputs/cap_vs_dt.csv")
 OUT_PATH = Path("paper/figs/fig_cap_engagement_small.pdf")
+COLUMNS  = ["dt", "fraction_capped_mean", "fraction_capped_ci95_low", "fraction_capped_ci95_high"]
 
-def main():
-    if not IN_PATH.exists():
-        raise FileNotFoundError(f"Missing input: {IN_PATH}")
+FIGSIZE, DPI = (6, 4), 150
+
+def render(in_path=IN_PATH, out_path=OUT_PATH, fig=None):
+    """Plot cap engagement vs dt from in_path into out_path, drawing on `fig` if given."""
+    if not in_path.exists():
+        raise FileNotFoundError(f"Missing input: {in_path}")
 
-    df = pd.read_csv(IN_PATH).sort_values("dt")
+    # Read only the expected columns as float64 (no pandas needed)
+    try:
+        arr = np.genfromtxt(in_path, delimiter=",", names=True, dtype=np.float64, usecols=COLUMNS,
+                            encoding="utf-8-sig")  # tolerate a BOM (Excel exports)
+    except ValueError as e:
+        raise ValueError(f"CSV missing expected columns {COLUMNS}: {e}") from e
+    arr = np.atleast_1d(arr)
+    arr.sort(order="dt")
 
-    # Expected columns: dt, fraction_capped_mean, fraction_capped_ci95_low, fraction_capped_ci95_high
-    if "fraction_capped_mean" not in df.columns:
-        raise ValueError(f"CSV missing expected column 'fraction_capped_mean'. Found: {list(df.columns)}")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    dt = arr["dt"]
+    mean = arr["fraction_capped_mean"]
+    lo = arr["fraction_capped_ci95_low"]
+    hi = arr["fraction_capped_ci95_high"]
+    # Asymmetric CI deltas as one (2, N) array
+    yerr = np.empty((2, mean.size))
+    np.subtract(mean, lo, out=yerr[0])
+    np.subtract(hi, mean, out=yerr[1])
 
-    plt.figure(figsize=(6, 4), dpi=150)
+    fig, own_fig = figstyle.prepare_figure(fig, FIGSIZE, DPI)
+    ax = fig.add_subplot()
 
     # Plot mean with error bars
-    plt.errorbar(
-        df["dt"], df["fraction_capped_mean"],
-        yerr=[df["fraction_capped_mean"] - df["fraction_capped_ci95_low"],
-              df["fraction_capped_ci95_high"] - df["fraction_capped_mean"]],
+    eb = ax.errorbar(
+        dt, mean, yerr=yerr,
         fmt="o-", capsize=4, color="tab:blue", label="Cap engagement"
     )
+    # Rasterize the data artists of long sweeps; axes, ticks and text stay vector
+    dense = dt.size >= figstyle.RASTERIZE_MIN_POINTS
+    if dense:
+        for artist in (eb[0], *eb[1], *eb[2]):
+            artist.set_rasterized(True)
 
-    plt.xlabel(r"Step size $dt$")
-    plt.ylabel("Cap engagement fraction")
-    plt.title("Energy Cap Engagement vs Step Size")
-    plt.grid(True, linestyle="--", alpha=0.6)
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(OUT_PATH)
-    plt.close()
-    print(f"Wrote {OUT_PATH}")
+    ax.set_xlabel(r"Step size $dt$")
+    ax.set_ylabel("Cap engagement fraction")
+    ax.set_title("Energy Cap Engagement vs Step Size")
+    ax.grid(True, linestyle="--", alpha=0.6)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=figstyle.RASTER_DPI if dense else DPI)
+    if own_fig:
+        plt.close(fig)
+    print(f"Wrote {out_path}")
+    return out_path
+
+def main():
+    render()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
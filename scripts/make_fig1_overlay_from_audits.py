@@ -37,17 +37,40 @@ import math
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict
 
+import figstyle
 import matplotlib as mpl
 mpl.rcParams["axes.unicode_minus"] = True
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
 from matplotlib.ticker import FuncFormatter, FixedLocator, LogFormatterMathtext, LogLocator, NullFormatter
 import numpy as np
 
+try:
+    import ijson  # optional: stream-parse very large audits
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: faster whole-file parse
+except ImportError:
+    orjson = None
+
+# Audits at least this large are streamed with ijson (if installed); smaller ones are
+# parsed whole, which is faster at typical audit sizes.
+STREAM_MIN_BYTES = 32 << 20
+
 
 def sha256_short(p: Path, n: int = 10) -> str:
-    """Generate short SHA256 hash of file."""
-    return hashlib.sha256(p.read_bytes()).hexdigest()[:n]
+    """Generate short SHA256 hash of file (streamed, no full-file read)."""
+    with p.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            h = hashlib.file_digest(f, "sha256")
+        else:
+            h = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                h.update(chunk)
+    return h.hexdigest()[:n]
 
 
 def _try_get(obj: dict, *keys, default=None):
@@ -84,6 +107,51 @@ def _fmt_mantissa_pow10(y, _pos):
     return rf"{m:.1f} Ã— 10$^{{{k}}}$"
 
 
+_AUDIT_KEYS = ("report", "series", "points", "n")
+_ITEM_KEYS = ("dt", "tail_median", "runs")
+
+
+def _stream_audit(audit_path: Path) -> dict:
+    """
+    One ijson pass over the top level, keeping only "report"/"series"/"points"/"n" with
+    report/series items cut down to dt, tail_median and runs. The result has the same
+    shape as json.loads, so load_series() picks keys identically on both paths.
+    """
+    obj: dict = {}
+    with audit_path.open("rb") as f:
+        for key, value in ijson.kvitems(f, "", use_float=True):
+            if key not in _AUDIT_KEYS:
+                continue
+            if key in ("report", "series") and isinstance(value, list):
+                value = [{k: it[k] for k in _ITEM_KEYS if k in it} if isinstance(it, dict) else it
+                         for it in value]
+            obj[key] = value
+    return obj
+
+
+def _parse_whole(audit_path: Path) -> dict:
+    """Parse a JSON file in one go: orjson if installed, else (or on NaN/Infinity) json."""
+    if orjson is not None:
+        try:
+            return orjson.loads(audit_path.read_bytes())
+        except orjson.JSONDecodeError:
+            pass  # orjson rejects NaN/Infinity, which json accepts
+    return json.loads(audit_path.read_text(encoding="utf-8"))
+
+
+def _read_audit(audit_path: Path) -> dict:
+    """
+    Parse an audit/summary JSON. Files of STREAM_MIN_BYTES or more are streamed with ijson
+    when installed; everything else (or anything ijson rejects) is parsed whole.
+    """
+    if ijson is not None and audit_path.stat().st_size >= STREAM_MIN_BYTES:
+        try:
+            return _stream_audit(audit_path)
+        except ijson.JSONError:
+            pass  # e.g. NaN/Infinity written by json.dump, which ijson rejects
+    return _parse_whole(audit_path)
+
+
 def load_series(audit_path: Path) -> Tuple[List[float], List[float], List[int], Optional[int]]:
     """
     Load (dt, tail_median, runs_list, n_points_if_available) from:
@@ -91,7 +159,7 @@ def load_series(audit_path: Path) -> Tuple[List[float], List[float], List[int],
       - *_slope_summary.json: has "points": [[dt, tail_median], ...] and "n"
     Returns (xs, ys, runs, n_points_or_None).
     """
-    obj = json.loads(audit_path.read_text(encoding="utf-8"))
+    obj = _read_audit(audit_path)
     xs, ys, runs = [], [], []
 
     # Case 1: plateau audit format
@@ -126,11 +194,22 @@ def load_series(audit_path: Path) -> Tuple[List[float], List[float], List[int],
         n_pts = None
 
     # sort by dt
-    z = sorted(zip(xs, ys, runs), key=lambda t: t[0])
-    xs = [x for x, _, _ in z]
-    ys = [y for _, y, _ in z]
-    runs = [r for _, _, r in z]
-    return xs, ys, runs, n_pts
+    xs_a = np.fromiter(xs, dtype=np.float64, count=len(xs))
+    ys_a = np.fromiter(ys, dtype=np.float64, count=len(ys))
+    runs_a = np.fromiter(runs, dtype=np.int64, count=len(runs))
+    idx = np.argsort(xs_a, kind="stable")
+    return xs_a[idx].tolist(), ys_a[idx].tolist(), runs_a[idx].tolist(), n_pts
+
+
+_series_cache: Dict[str, Tuple[List[float], List[float], List[int], Optional[int]]] = {}
+
+
+def load_series_cached(audit_path: Path, digest: str) -> Tuple[List[float], List[float], List[int], Optional[int]]:
+    """load_series() memoized on file digest, so byte-identical inputs are parsed once."""
+    hit = _series_cache.get(digest)
+    if hit is None:
+        hit = _series_cache[digest] = load_series(audit_path)
+    return hit
 
 
 def ols_log10(xs: List[float], ys: List[float]) -> Optional[Dict[str, float]]:
@@ -138,22 +217,27 @@ def ols_log10(xs: List[float], ys: List[float]) -> Optional[Dict[str, float]]:
     OLS of log10(y) ~ m * log10(x) + b with a simple 95% CI for m and R^2.
     Requires >= 3 points.
     """
-    pts = [(x, y) for x, y in zip(xs, ys) if x > 0 and y > 0]
-    if len(pts) < 3:
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+    mask = (x > 0) & (y > 0)
+    n = int(mask.sum())
+    if n < 3:
         return None
-    lx = [math.log10(x) for x, _ in pts]
-    ly = [math.log10(y) for _, y in pts]
-    n = len(lx)
-    xm = sum(lx) / n
-    ym = sum(ly) / n
-    sxx = sum((x - xm) ** 2 for x in lx)
+    lx = np.log10(x[mask])
+    ly = np.log10(y[mask])
+    xm = float(lx.mean())
+    ym = float(ly.mean())
+    dx = lx - xm
+    dy = ly - ym
+    sxx = float(dx @ dx)
     if sxx == 0:
         return None
-    sxy = sum((x - xm) * (y - ym) for x, y in zip(lx, ly))
+    sxy = float(dx @ dy)
     m = sxy / sxx
     b = ym - m * xm
-    rss = sum((y - (m * x + b)) ** 2 for x, y in zip(lx, ly))
-    tss = sum((y - ym) ** 2 for y in ly)
+    resid = ly - (m * lx + b)
+    rss = float(resid @ resid)
+    tss = float(dy @ dy)
     r2 = 0.0 if tss == 0 else 1 - rss / tss
     df = n - 2
     s2 = rss / max(1, df)
@@ -180,11 +264,10 @@ def fmt_small_dt(x: float, _pos: int) -> str:
     return f"{x:.4f}".rstrip("0").rstrip(".")
 
 
-def nearly_identical(a: List[float], b: List[float], tol: float = 1e-12) -> bool:
-    """Check if two series are numerically identical within tolerance."""
-    if len(a) != len(b):
-        return False
-    return all(abs(x - y) <= tol for x, y in zip(a, b))
+def series_digest(xs: np.ndarray, ys: np.ndarray, decimals: int = 12) -> str:
+    """Digest of a series rounded to `decimals`; equal digests mean numerically identical series."""
+    blob = np.round(xs, decimals).tobytes() + b"|" + np.round(ys, decimals).tobytes()
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
 
 
 def make_overlay(
@@ -199,8 +282,9 @@ def make_overlay(
     caption_in_figure: bool = True,
     thrash_jitter_pct: float = 0.0,
     style: str = "overlay",
-) -> None:
-    """Create overlay plot from audit files."""
+    fig: Optional[Figure] = None,
+) -> Path:
+    """Create overlay plot from audit files; `fig` optionally supplies a Figure to draw on."""
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     specs = []
@@ -213,8 +297,11 @@ def make_overlay(
     # Hash prints + duplicate-file warning
     print("[INFO] input hashes (sha256[:10]):")
     digests = []
+    full_digests = {}  # label -> full sha256, reused as the load_series cache key
     for lbl, p, *_ in specs:
-        d = sha256_short(p)
+        full = sha256_short(p, n=64)
+        full_digests[lbl] = full
+        d = full[:10]
         digests.append((lbl, d))
         print(f"    {lbl:11s} {d}  {p}")
     buckets = {}
@@ -225,32 +312,35 @@ def make_overlay(
         print("[WARN] Two or more inputs are byte-identical:", dups)
 
     # Figure style
-    plt.rcParams["font.size"] = 10
-    fig = plt.figure(figsize=(6.6, 4.4), dpi=200)
-    ax = plt.gca()
+    fig_dpi = 200
+    fig, own_fig = figstyle.prepare_figure(fig, (6.6, 4.4), fig_dpi, layout="constrained")
+    ax = fig.add_subplot()
     ax.set_xscale("log")
     ax.set_yscale("log")
 
     dt_all = set()
     handles, labels, caption = [], [], []
-    series_data = {}  # label -> (xs, ys)
+    series_data = {}  # label -> (xs, ys) as float64 arrays
+    any_dense = False  # any series rasterized -> save at RASTER_DPI
 
     for label, path, color, marker, lstyle in specs:
-        xs, ys, runs, _n_pts = load_series(path)
+        xs, ys, runs, _n_pts = load_series_cached(path, full_digests[label])
         if label.lower().endswith("thrash") and thrash_jitter_pct:
             xs = [x * (1.0 + thrash_jitter_pct / 100.0) for x in xs]
 
-        series_data[label] = (xs, ys)
+        series_data[label] = (np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64))
         dt_all.update(xs)
 
         if not xs:
             continue
 
-        # line then markers
-        ax.loglog(xs, ys, color=color, linestyle=lstyle, linewidth=2.1, alpha=1.0, zorder=2)
-        ax.loglog(xs, ys, color=color, linestyle="None", marker=marker,
-                  markersize=6, markerfacecolor="white", markeredgecolor=color,
-                  markeredgewidth=1.2, zorder=3)
+        # line + markers in one artist (axes are already log-scaled); long series
+        # are rasterized in the PDF while axes, ticks and text stay vector
+        dense = len(xs) >= figstyle.RASTERIZE_MIN_POINTS
+        any_dense = any_dense or dense
+        ax.plot(xs, ys, color=color, linestyle=lstyle, linewidth=2.1, marker=marker,
+                markersize=6, markerfacecolor="white", markeredgecolor=color,
+                markeredgewidth=1.2, zorder=2, rasterized=dense)
 
         fit = ols_log10(xs, ys)
         leg_text = label
@@ -260,9 +350,8 @@ def make_overlay(
                 # FIXED: Use mathtext to avoid encoding issues in PDF backends
                 leg_text = rf"{label} (low $R^2$)"
             if show_fit:
-                x0, x1 = min(xs), max(xs)
-                xx = [x0, x1]
-                yy = [10 ** (m * math.log10(x) + fit["b"]) for x in xx]
+                xx = np.asarray([min(xs), max(xs)])
+                yy = 10.0 ** (m * np.log10(xx) + fit["b"])
                 ax.loglog(xx, yy, color=color, alpha=0.18, linewidth=1.2, zorder=1)
             caption.append(f"{label}: m={m:+.3f} [{lo:+.3f},{hi:+.3f}] R^2={r2:.2f}")
         else:
@@ -273,15 +362,15 @@ def make_overlay(
                               markeredgewidth=1.2, linewidth=2.1))
         labels.append(leg_text)
 
-    # numeric duplicate warning
-    keys = list(series_data.keys())
-    for i in range(len(keys)):
-        for j in range(i + 1, len(keys)):
-            a, b = keys[i], keys[j]
-            xa, ya = series_data[a]
-            xb, yb = series_data[b]
-            if xa and xb and nearly_identical(xa, xb) and nearly_identical(ya, yb):
-                print(f"[WARN] Series '{a}' and '{b}' appear numerically identical.")
+    # numeric duplicate warning: bucket series by a digest of their values
+    series_buckets: Dict[str, List[str]] = {}
+    for label, (xa, ya) in series_data.items():
+        if xa.size:
+            series_buckets.setdefault(series_digest(xa, ya), []).append(label)
+    for labs in series_buckets.values():
+        if len(labs) > 1:
+            names = ", ".join(f"'{lab}'" for lab in labs)
+            print(f"[WARN] Series {names} appear numerically identical.")
 
     # Tick policy toggled by style
     style = (style or "overlay").lower()
@@ -335,12 +424,15 @@ def make_overlay(
                 bbox=dict(boxstyle="round,pad=0.25", fc="white", ec="none", alpha=0.75),
                 zorder=4)
 
-    fig.tight_layout()
-    fig.savefig(out_path, transparent=True, bbox_inches="tight", pad_inches=0.04)
-    plt.close(fig)
+    # constrained layout sizes the margins; no tight_layout/bbox_inches="tight" second pass
+    fig.savefig(out_path, transparent=True,
+                dpi=figstyle.RASTER_DPI if any_dense else fig_dpi)
+    if own_fig:
+        plt.close(fig)
     print(f"[OK] wrote: {out_path}")
     print("[Caption Suggestion]")
     print("; ".join(caption))
+    return out_path
 
 
 def parse_args() -> argparse.Namespace:
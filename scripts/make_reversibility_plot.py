@@ -9,16 +9,20 @@ Writes: paper/figs/fig_reversibility_demo.pdf
 import json
 from pathlib import Path
 
+import figstyle
 import matplotlib.pyplot as plt
 
 IN_PATH  = Path("outputs/reversibility_demo.json")
 OUT_PATH = Path("paper/figs/fig_reversibility_demo.pdf")
 
-def main():
-    if not IN_PATH.exists():
-        raise FileNotFoundError(f"Missing input: {IN_PATH}  (run reversibility_demo.py first)")
+FIGSIZE, DPI = (6.0, 4.0), 150
+
+def render(in_path=IN_PATH, out_path=OUT_PATH, fig=None):
+    """Plot the leapfrog vs Euler round-trip errors into out_path, drawing on `fig` if given."""
+    if not in_path.exists():
+        raise FileNotFoundError(f"Missing input: {in_path}  (run reversibility_demo.py first)")
 
-    data = json.loads(IN_PATH.read_text(encoding="utf-8"))
+    data = json.loads(in_path.read_text(encoding="utf-8"))
     k  = data.get("k", "?")
     dt = data.get("dt", "?")
 
@@ -29,23 +33,29 @@ def main():
     ]
 
     # Make sure output dir exists
-    OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Plot (matplotlib, no special styles/colors)
-    plt.figure(figsize=(6.0, 4.0), dpi=150)
-    bars = plt.bar(labels, vals)
-    plt.ylabel("Normalized Round-Trip Error")
-    plt.title(f"Reversibility Test (k={k}, dt={dt})")
+    fig, own_fig = figstyle.prepare_figure(fig, FIGSIZE, DPI)
+    ax = fig.add_subplot()
+    bars = ax.bar(labels, vals)
+    ax.set_ylabel("Normalized Round-Trip Error")
+    ax.set_title(f"Reversibility Test (k={k}, dt={dt})")
 
     # Annotate bars with values
     for b, v in zip(bars, vals):
-        plt.text(b.get_x() + b.get_width()/2, b.get_height(),
+        ax.text(b.get_x() + b.get_width()/2, b.get_height(),
                  f"{v:.2e}", ha="center", va="bottom", fontsize=9)
 
-    plt.tight_layout()
-    plt.savefig(OUT_PATH)
-    plt.close()
-    print(f"Wrote {OUT_PATH}")
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=DPI)
+    if own_fig:
+        plt.close(fig)
+    print(f"Wrote {out_path}")
+    return out_path
+
+def main():
+    render()
 
 if __name__ == "__main__":
     main()